@@ -0,0 +1,137 @@
+"""
+Visual downsampling helpers for the Plotly charts.
+
+Browsers struggle once a figure carries tens of thousands of points,
+while a chart only has a few thousand pixel columns to draw them in.
+`lttb` picks representative points for line traces using the
+Largest-Triangle-Three-Buckets algorithm, and `ohlc_bins` merges
+candlesticks into buckets keeping the first open, highest high, lowest
+low and last close (the M4 idea applied to OHLC data). `peak_bins`
+reduces bar traces by keeping the tallest bar of each bucket. All of
+them work on bar positions so callers can take matching timestamps
+from the original index.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ._njit import njit
+
+
+def lttb(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select the positions of `n_out` points that preserve a line's shape.
+
+    Bars are treated as equally spaced. NaN values (e.g. indicator
+    warm-up) are skipped since Plotly would not draw them anyway.
+
+    Args:
+        y: Values of the line trace.
+        n_out: Number of points to keep, including both endpoints.
+
+    Returns:
+        Sorted positions into `y` of the points to draw.
+    """
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n_out >= n or n_out < 3:
+        return valid
+    yv = y[valid].astype(np.float64)
+    # Interior buckets split [1, n - 1); the endpoints are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Each bucket is scored against the average of the following one (the
+    # last point for the final bucket); those averages do not depend on
+    # earlier picks, so they are computed for all buckets at once.
+    nxt_start = edges[1:]
+    nxt_end = np.append(edges[2:], n)
+    cs = np.concatenate(([0.0], np.cumsum(yv)))
+    count = nxt_end - nxt_start
+    avg_x = (nxt_start + nxt_end - 1) / 2
+    avg_y = (cs[nxt_end] - cs[nxt_start]) / count
+    return valid[_lttb_select(yv, edges, avg_x, avg_y)]
+
+
+@njit(cache=True, nogil=True)
+def _lttb_select(yv: np.ndarray, edges: np.ndarray, avg_x: np.ndarray, avg_y: np.ndarray) -> np.ndarray:
+    """Pick the largest-triangle point of each bucket in turn.
+
+    Each pick depends on the previous one, so the loop over buckets
+    cannot be vectorised. For 20k points it takes well under a
+    millisecond when Numba is installed and about 20 ms per trace
+    otherwise.
+    """
+    n_buckets = edges.shape[0] - 1
+    x = np.arange(yv.shape[0]).astype(np.float64)
+    out = np.empty(n_buckets + 2, dtype=np.int64)
+    out[0] = 0
+    out[-1] = yv.shape[0] - 1
+    a = 0
+    for i in range(n_buckets):
+        start, end = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - avg_x[i]) * (yv[start:end] - yv[a])
+            - (x[a] - x[start:end]) * (avg_y[i] - yv[a])
+        )
+        a = start + np.argmax(area)
+        out[i + 1] = a
+    return out
+
+
+def peak_bins(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select the largest-magnitude value in each of `n_out` buckets.
+
+    Suited to bar traces such as a histogram, where dropping bars by
+    line shape would hide peaks and sign changes.
+
+    Args:
+        y: Bar heights.
+        n_out: Maximum number of buckets.
+
+    Returns:
+        Sorted positions into `y` of the bars to draw; buckets that are
+        entirely NaN are skipped.
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    starts = np.linspace(0, n, n_out, endpoint=False).astype(np.int64)
+    mag = np.abs(y)
+    peak = np.fmax.reduceat(mag, starts)
+    bucket = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, n)))
+    # First position in each bucket whose magnitude equals the bucket peak
+    hits = np.flatnonzero(mag == peak[bucket])
+    _, first = np.unique(bucket[hits], return_index=True)
+    return hits[first]
+
+
+def ohlc_bins(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    n_out: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Aggregate OHLC bars into at most `n_out` equally sized buckets.
+
+    Args:
+        open_, high, low, close: Price arrays of equal length.
+        n_out: Maximum number of buckets.
+
+    Returns:
+        A tuple of (starts, open, high, low, close) where `starts` holds
+        the position of the first bar in each bucket.
+    """
+    n = len(open_)
+    if n <= n_out:
+        return np.arange(n), open_, high, low, close
+    starts = np.linspace(0, n, n_out, endpoint=False).astype(np.int64)
+    ends = np.append(starts[1:], n) - 1
+    return (
+        starts,
+        open_[starts],
+        np.fmax.reduceat(high, starts),
+        np.fmin.reduceat(low, starts),
+        close[ends],
+    )
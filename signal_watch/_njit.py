@@ -0,0 +1,27 @@
+"""
+Optional Numba support for the indicator kernels.
+
+Numba is not a required dependency. When it is installed, `njit` is
+Numba's decorator and `NUMBA_AVAILABLE` is True. Otherwise `njit` is a
+no-op that returns the decorated function unchanged, so modules using
+it still import and the kernels remain callable as plain Python.
+"""
+
+from __future__ import annotations
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback for `numba.njit` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
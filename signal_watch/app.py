@@ -16,9 +16,11 @@ and execute:
 from __future__ import annotations
 
 import json
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
 
 from . import data
@@ -28,18 +30,81 @@ from . import charts
 from . import search
 from . import storage
 
+# Shortest search query that is sent to Yahoo, unless it is a single
+# letter (one-letter tickers such as F or T must stay reachable)
+MIN_SEARCH_CHARS = 2
+
+# Worker threads used to compute watchlist snapshots concurrently
+SNAPSHOT_WORKERS = 8
+
+# Enriched frames kept between polls so new bars extend them in place of
+# a full recompute; shared by all sessions and evicted after ten minutes
+ENRICHED_CACHE_ENTRIES = 256
+
+# Overview ordering for the majority recommendation: BUY first, SELL last
+MAJORITY_SORT_KEY = {signals.State.BUY: 0, signals.State.HOLD: 1, signals.State.SELL: 2}
+
+# Coloured dot shown for each indicator state
+_STATE_DOT = {signals.State.BUY: "🟢", signals.State.SELL: "🔴", signals.State.HOLD: "🟡"}
+
+# Display names for the snapshot fields shown in the overview table
+OVERVIEW_COLUMNS = {
+    "symbol": "Ticker",
+    "price": "Price",
+    "macd": "MACD",
+    "rsi": "RSI",
+    "bb": "BB",
+    "majority": "Majority",
+    "time": "Time",
+}
+
 
 @st.cache_data(show_spinner=False, ttl=60)
-def compute_snapshot(symbol: str, tf_key: str) -> Dict[str, Any]:
-    """Compute the latest signal snapshot for a symbol/timeframe.
+def get_enriched(symbol: str, tf_key: str) -> Tuple[pd.DataFrame, str]:
+    """Fetch a symbol/timeframe and attach indicators behind a cache.
 
-    This helper wraps fetching, indicator attachment and snapshot
-    calculation behind a cache for performance. The TTL is short to
-    allow intraday updates. If fetching or computation fails, the
-    error is propagated.
+    Streamlit reruns the whole script on every widget interaction, so
+    caching the enriched frame means toggling an indicator or the theme
+    does not repeat the EWM and rolling computations. Both this cache
+    and `data.fetch` expire after a minute, so new bars show up within
+    about two.
+
+    Returns:
+        A tuple of (DataFrame with indicator columns, price_column_name).
     """
     df, price_col = data.fetch(symbol, tf_key)
-    df = indicators.attach_indicators(df, price_col)
+    return indicators.attach_indicators(df, price_col), price_col
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def get_chart(
+    fingerprint: Tuple[str, str, int, int, float],
+    show_macd: bool,
+    show_rsi: bool,
+    show_bb: bool,
+    theme_dark: bool,
+) -> go.Figure:
+    """Build the detail chart once per data version and display options.
+
+    The DataFrame itself is not part of the cache key; ``fingerprint``
+    is ``(symbol, tf_key, len(df), last_timestamp_ns, last_price)`` for
+    the frame returned by `get_enriched`, which is looked up again here.
+    The last price covers a still-forming bar that updates in place. Reruns
+    that leave the data and toggles unchanged reuse the same Figure
+    object, so callers must not mutate it.
+    """
+    symbol, tf_key = fingerprint[:2]
+    df, price_col = get_enriched(symbol, tf_key)
+    return charts.build_chart(df, price_col, show_macd, show_rsi, show_bb, theme_dark)
+
+
+def compute_snapshot(symbol: str, df: pd.DataFrame, price_col: str) -> Dict[str, Any]:
+    """Compute the latest signal snapshot for a symbol.
+
+    Summarises the indicator states at the most recent bar of a
+    DataFrame that already carries indicator columns. Errors are
+    propagated to the caller.
+    """
     snap = signals.latest_snapshot(df, price_col)
     last_price = df[price_col].iloc[-1]
     return {
@@ -50,51 +115,120 @@ def compute_snapshot(symbol: str, tf_key: str) -> Dict[str, Any]:
         "bb": snap["bb"],
         "majority": snap["majority"],
         "time": str(snap["index"]),
+        "sort_key": MAJORITY_SORT_KEY[snap["majority"]],
     }
 
 
+def compute_snapshot_incremental(
+    symbol: str,
+    df: pd.DataFrame,
+    price_col: str,
+    prev: Optional[Tuple[pd.DataFrame, Optional[indicators.IndicatorState]]],
+) -> Tuple[Dict[str, Any], Tuple[pd.DataFrame, Optional[indicators.IndicatorState]]]:
+    """Compute a snapshot, extending the previous poll's indicators.
+
+    Only bars that are new since ``prev`` are run through the indicator
+    recurrences; see `indicators.update_indicators`.
+
+    Returns:
+        A tuple of (snapshot, entry) where entry should be stored and
+        passed back as ``prev`` on the next poll.
+    """
+    entry = indicators.update_indicators(df, price_col, prev)
+    return compute_snapshot(symbol, entry[0], price_col), entry
+
+
+@st.cache_resource(ttl=600, max_entries=ENRICHED_CACHE_ENTRIES, show_spinner=False)
+def _enriched_slot(symbol: str, tf_key: str) -> Dict[str, Any]:
+    """Process-wide holder of the last enriched frame for a symbol.
+
+    `compute_snapshots` stores the (DataFrame, state) entry returned by
+    `compute_snapshot_incremental` under ``"entry"`` and reads it back
+    on the next poll. Entries are replaced, never mutated, so sessions
+    polling the same symbol can share a slot.
+    """
+    return {}
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def compute_snapshots(symbols: Tuple[str, ...], tf_key: str) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    """Compute signal snapshots for a whole watchlist.
+
+    All symbols are downloaded in a single batched request and the
+    snapshots are then built in memory on a small thread pool. The TTL
+    is short to allow intraday updates. When a poll brings new bars, the
+    previous poll's enriched frames are extended rather than recomputed
+    where that is cheaper (see `indicators.update_indicators`).
+
+    Returns:
+        A tuple of (rows, errors) where rows holds one snapshot per
+        symbol that succeeded and errors maps failed symbols to a
+        message.
+    """
+    frames = data.fetch_many(symbols, tf_key)
+    # Look the slots up on the script thread, which carries the run context
+    slots = {sym: _enriched_slot(sym, tf_key) for sym in symbols}
+
+    def work(sym: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        if sym not in frames:
+            return None, "No data returned. Try a different timeframe or symbol."
+        df, price_col = frames[sym]
+        slot = slots[sym]
+        try:
+            snap, entry = compute_snapshot_incremental(sym, df, price_col, slot.get("entry"))
+        except Exception as e:
+            return None, str(e)
+        # Only hold on to frames that a later poll can extend
+        slot["entry"] = entry if entry[1] is not None else None
+        return snap, None
+
+    rows = []
+    errors = {}
+    if not symbols:
+        return rows, errors
+    # The indicator kernels release the GIL, so symbols overlap in threads
+    with ThreadPoolExecutor(max_workers=min(SNAPSHOT_WORKERS, len(symbols))) as ex:
+        for sym, (snap, err) in zip(symbols, ex.map(work, symbols)):
+            if err is None:
+                rows.append(snap)
+            else:
+                errors[sym] = err
+    return rows, errors
+
+
 def state_dot(state: signals.State) -> str:
     """Render a coloured dot emoji for a given state."""
-    return {signals.State.BUY: "🟢", signals.State.SELL: "🔴", signals.State.HOLD: "🟡"}[state]
+    return _STATE_DOT[state]
 
 
 def display_watchlist_overview(tf_key: str, show_macd: bool, show_rsi: bool, show_bb: bool) -> None:
     """Render the watchlist overview table.
 
-    Iterates over the current watchlist, computes snapshots and displays
-    them in a table with colour coded indicator states. Rows include
-    buttons to open the detail view for each symbol.
+    Computes snapshots for the current watchlist in one batch and
+    displays them in a table with colour coded indicator states. Rows
+    include buttons to open the detail view for each symbol.
     """
-    watchlist = st.session_state.get("watchlist", [])
+    watchlist = storage.get_watchlist()
     if not watchlist:
         st.info("Your watchlist is empty. Add a ticker using the sidebar to get started.")
         return
-    rows = []
-    errors = {}
-    for sym in watchlist:
-        try:
-            snap = compute_snapshot(sym, tf_key)
-            rows.append(snap)
-        except Exception as e:
-            errors[sym] = str(e)
+    try:
+        rows, errors = compute_snapshots(tuple(watchlist), tf_key)
+    except Exception as e:
+        st.error(str(e))
+        return
     if rows:
-        # Build DataFrame for display
-        df_rows = []
-        for row in rows:
-            df_rows.append({
-                "Ticker": row["symbol"],
-                "Price": row["price"],
-                "MACD": state_dot(row["macd"]),
-                "RSI": state_dot(row["rsi"]),
-                "BB": state_dot(row["bb"]),
-                "Majority": row["majority"].value,
-                "Time": row["time"],
-            })
-        df_display = pd.DataFrame(df_rows)
-        # Sort by majority (BUY first) and number of buy dots
-        def buy_count(r):
-            return (1 if r["MACD"] == "🟢" else 0) + (1 if r["RSI"] == "🟢" else 0) + (1 if r["BB"] == "🟢" else 0)
-        df_display.sort_values(by=["Majority", "Ticker"], ascending=[True, True], inplace=True)
+        # Build DataFrame for display straight from the snapshot dicts
+        df_display = pd.DataFrame.from_records(rows)
+        for col in ("macd", "rsi", "bb"):
+            df_display[col] = df_display[col].map(state_dot)
+        df_display["majority"] = df_display["majority"].map(lambda s: s.value)
+        # Sort by majority (BUY, HOLD, SELL) then ticker on the integer key
+        df_display = (
+            df_display.sort_values(["sort_key", "symbol"], kind="stable")
+            .drop(columns="sort_key")
+            .rename(columns=OVERVIEW_COLUMNS)
+        )
         st.dataframe(df_display, hide_index=True)
     if errors:
         for sym, err in errors.items():
@@ -118,15 +252,16 @@ def run() -> None:
     st.sidebar.subheader("Watchlist")
     sym_in = st.sidebar.text_input("Add symbol", key="add_symbol")
     if st.sidebar.button("Add", key="add_button"):
-        if sym_in:
-            storage.add_to_watchlist(sym_in.strip().upper())
-            st.sidebar.success(f"Added {sym_in.strip().upper()} to watchlist.")
-    # Import/export watchlist
-    storage.import_watchlist_uploader()
-    storage.export_watchlist_button()
+        sym = sym_in.strip().upper()
+        if sym:
+            if storage.add_to_watchlist(sym):
+                st.sidebar.success(f"Added {sym} to watchlist.")
+            else:
+                st.sidebar.warning(f"Watchlist is full ({storage.MAX_WATCHLIST} tickers).")
+    # Import/export watchlist, isolated from unrelated reruns
+    storage.watchlist_panel()
     # Show current watchlist with remove buttons
-    watchlist = st.session_state.get("watchlist", [])
-    for sym in list(watchlist):
+    for sym in storage.get_watchlist():
         cols = st.sidebar.columns([3, 1])
         cols[0].write(sym)
         if cols[1].button("✕", key=f"rm_{sym}"):
@@ -136,7 +271,11 @@ def run() -> None:
     st.title("Signal Watch")
     query = st.text_input("Search ticker or company", key="search_query")
     selected_symbol = st.session_state.get("selected_symbol")
-    if query:
+    # A lone digit or symbol matches too broadly to be worth a request;
+    # single letters still search since they can be complete tickers
+    if query and len(query) < MIN_SEARCH_CHARS and not query.isalpha():
+        st.caption(f"Type at least {MIN_SEARCH_CHARS} characters to search.")
+    elif query:
         suggestions = search.yahoo_search(query)
         if suggestions:
             option_labels = [f"{x['symbol']} — {x['name']} ({x['exchange']})" for x in suggestions]
@@ -152,9 +291,15 @@ def run() -> None:
         # Detail view
         st.header(selected_symbol)
         try:
-            df, price_col = data.fetch(selected_symbol, tf_key)
-            df = indicators.attach_indicators(df, price_col)
-            fig = charts.build_chart(df, price_col, show_macd, show_rsi, show_bb, theme_dark)
+            df, price_col = get_enriched(selected_symbol, tf_key)
+            fingerprint = (
+                selected_symbol,
+                tf_key,
+                len(df),
+                df.index[-1].value,
+                float(df[price_col].iloc[-1]),
+            )
+            fig = get_chart(fingerprint, show_macd, show_rsi, show_bb, theme_dark)
             st.plotly_chart(fig, use_container_width=True)
             # Signal summary
             snap = signals.latest_snapshot(df, price_col)
@@ -4,7 +4,8 @@ Plotly chart construction for the Streamlit stock watch app.
 This module defines a function `build_chart` that assembles a multi‑row
 Plotly Figure containing a candlestick chart with optional Bollinger
 bands along with MACD and RSI subplots. Markers are added to
-highlight buy/sell signal flips for each indicator.
+highlight buy/sell signal flips for each indicator. Long histories are
+visually downsampled before being handed to Plotly.
 """
 
 from __future__ import annotations
@@ -16,7 +17,30 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-from .signals import State, macd_state, rsi_state, bb_state
+from ._downsample import lttb, ohlc_bins, peak_bins
+from .signals import BUY_CODE, SELL_CODE, bb_states
+
+# Traces longer than this are downsampled to this many points before
+# plotting; signal markers still come from the full resolution data.
+MAX_RENDER_POINTS = 3000
+
+
+def _line_xy(df_plot: pd.DataFrame, col: str) -> tuple[pd.Index, np.ndarray]:
+    """Return the x/y data to draw for a line trace, LTTB reduced if long."""
+    y = df_plot[col].to_numpy()
+    if len(y) <= MAX_RENDER_POINTS:
+        return df_plot.index, y
+    keep = lttb(y, MAX_RENDER_POINTS)
+    return df_plot.index[keep], y[keep]
+
+
+def _bar_xy(df_plot: pd.DataFrame, col: str) -> tuple[pd.Index, np.ndarray]:
+    """Return the x/y data to draw for a bar trace, keeping bucket peaks if long."""
+    y = df_plot[col].to_numpy()
+    if len(y) <= MAX_RENDER_POINTS:
+        return df_plot.index, y
+    keep = peak_bins(y, MAX_RENDER_POINTS)
+    return df_plot.index[keep], y[keep]
 
 
 def build_chart(
@@ -45,11 +69,12 @@ def build_chart(
     """
     # Optionally downsample long histories for performance. Indicators should
     # be computed on full resolution data; here we only reduce what gets
-    # drawn. Keep the last max_points rows.
+    # drawn. Keep the last max_points rows. df_plot is never mutated, so a
+    # view is enough and traces receive plain NumPy arrays.
     if max_points is not None and len(df) > max_points:
-        df_plot = df.iloc[-max_points:].copy()
+        df_plot = df.iloc[-max_points:]
     else:
-        df_plot = df.copy()
+        df_plot = df
     rows = 1
     row_heights = [0.6]
     if show_macd:
@@ -65,14 +90,21 @@ def build_chart(
         vertical_spacing=0.02,
         row_heights=row_heights,
     )
-    # Price candlestick
+    # Price candlestick, merged into OHLC buckets for long histories
+    starts, opens, highs, lows, closes = ohlc_bins(
+        df_plot["Open"].to_numpy(),
+        df_plot["High"].to_numpy(),
+        df_plot["Low"].to_numpy(),
+        df_plot["Close"].to_numpy(),
+        MAX_RENDER_POINTS,
+    )
     fig.add_trace(
         go.Candlestick(
-            x=df_plot.index,
-            open=df_plot["Open"],
-            high=df_plot["High"],
-            low=df_plot["Low"],
-            close=df_plot["Close"],
+            x=df_plot.index[starts],
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
             name="Price",
         ),
         row=1,
@@ -80,33 +112,39 @@ def build_chart(
     )
     # Bollinger bands overlay
     if show_bb:
+        x, y = _line_xy(df_plot, "BB_UPPER")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["BB_UPPER"], mode="lines", name="BB Upper"),
+            go.Scattergl(x=x, y=y, mode="lines", name="BB Upper"),
             row=1, col=1
         )
+        x, y = _line_xy(df_plot, "BB_MID")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["BB_MID"], mode="lines", name="BB Middle"),
+            go.Scattergl(x=x, y=y, mode="lines", name="BB Middle"),
             row=1, col=1
         )
+        x, y = _line_xy(df_plot, "BB_LOWER")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["BB_LOWER"], mode="lines", name="BB Lower"),
+            go.Scattergl(x=x, y=y, mode="lines", name="BB Lower"),
             row=1, col=1
         )
     # MACD subplot
     row_idx = 2 if show_macd else None
     if show_macd:
         # MACD line and signal line
+        x, y = _line_xy(df_plot, "MACD")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["MACD"], mode="lines", name="MACD"),
+            go.Scattergl(x=x, y=y, mode="lines", name="MACD"),
             row=row_idx, col=1
         )
+        x, y = _line_xy(df_plot, "MACD_SIGNAL")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["MACD_SIGNAL"], mode="lines", name="Signal"),
+            go.Scattergl(x=x, y=y, mode="lines", name="Signal"),
             row=row_idx, col=1
         )
         # Histogram
+        x, y = _bar_xy(df_plot, "MACD_HIST")
         fig.add_trace(
-            go.Bar(x=df_plot.index, y=df_plot["MACD_HIST"], name="Histogram"),
+            go.Bar(x=x, y=y, name="Histogram"),
             row=row_idx, col=1
         )
     # RSI subplot
@@ -117,49 +155,28 @@ def build_chart(
             rsi_row = 3 if show_rsi else None
         else:
             rsi_row = 2 if show_rsi else None
+        x, y = _line_xy(df_plot, "RSI")
         fig.add_trace(
-            go.Scatter(x=df_plot.index, y=df_plot["RSI"], mode="lines", name="RSI"),
-            row=rsi_row, col=1
-        )
-        # Add overbought/oversold lines
-        fig.add_trace(
-            go.Scatter(x=df_plot.index, y=[70] * len(df_plot), mode="lines", name="RSI 70", line=dict(dash="dash")),
-            row=rsi_row, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df_plot.index, y=[50] * len(df_plot), mode="lines", name="RSI 50", line=dict(dash="dash")),
-            row=rsi_row, col=1
-        )
-        fig.add_trace(
-            go.Scatter(x=df_plot.index, y=[30] * len(df_plot), mode="lines", name="RSI 30", line=dict(dash="dash")),
+            go.Scattergl(x=x, y=y, mode="lines", name="RSI"),
             row=rsi_row, col=1
         )
+        # Add overbought/oversold lines as layout shapes rather than traces
+        for level in (70, 50, 30):
+            fig.add_hline(y=level, line_dash="dash", row=rsi_row, col=1)
     # Add markers for indicator flips on price pane (only Bollinger)
-    # Identify buy/sell events for each indicator
-    marker_yoffset = (df_plot["Low"].min() * 0.99, df_plot["High"].max() * 1.01)
-    # Precompute states on downsampled data
-    macd_states = []
-    rsi_states = []
-    bb_states = []
-    for i in range(len(df_plot)):
-        macd_states.append(macd_state(df_plot, i))
-        rsi_states.append(rsi_state(df_plot, i))
-        bb_states.append(bb_state(df_plot, i, price_col))
-    # Price pane markers for Bollinger signals
-    buy_x = []
-    buy_y = []
-    sell_x = []
-    sell_y = []
-    for i, st in enumerate(bb_states):
-        if st == State.BUY:
-            buy_x.append(df_plot.index[i])
-            buy_y.append(df_plot["Low"].iloc[i])
-        elif st == State.SELL:
-            sell_x.append(df_plot.index[i])
-            sell_y.append(df_plot["High"].iloc[i])
-    if buy_x:
+    # States come from one vectorised pass as int8 codes
+    bb_codes = bb_states(df_plot, price_col)
+    bb_buy = bb_codes == BUY_CODE
+    bb_sell = bb_codes == SELL_CODE
+    # Price pane markers for Bollinger signals, gathered by boolean mask.
+    # x stays an Index: .values would drop the timezone of intraday data.
+    buy_x = df_plot.index[bb_buy]
+    buy_y = df_plot["Low"].to_numpy()[bb_buy]
+    sell_x = df_plot.index[bb_sell]
+    sell_y = df_plot["High"].to_numpy()[bb_sell]
+    if len(buy_x):
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=buy_x,
                 y=buy_y,
                 mode="markers",
@@ -169,9 +186,9 @@ def build_chart(
             row=1,
             col=1,
         )
-    if sell_x:
+    if len(sell_x):
         fig.add_trace(
-            go.Scatter(
+            go.Scattergl(
                 x=sell_x,
                 y=sell_y,
                 mode="markers",
@@ -2,16 +2,17 @@
 Data fetching and caching functions for the Streamlit app.
 
 This module wraps the free Yahoo Finance API (via yfinance) and
-predefines a set of common timeframes. It exposes a single `fetch`
-function that returns a DataFrame and the name of the price column used
-for indicator computations. Results are cached by Streamlit based on
-time to live (TTL) depending on whether data are intraday or daily.
+predefines a set of common timeframes. It exposes a `fetch` function
+that returns a DataFrame and the name of the price column used for
+indicator computations, plus `fetch_many` which downloads a whole
+watchlist in one batched request. Results are cached by Streamlit based
+on time to live (TTL) depending on whether data are intraday or daily.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Tuple
+from typing import Dict, Iterable, Tuple
 
 import pandas as pd
 import streamlit as st
@@ -34,12 +35,13 @@ TF = {
 }
 
 
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=60)
 def fetch(symbol: str, tf_key: str) -> Tuple[pd.DataFrame, str]:
     """Fetch market data for a symbol and timeframe.
 
     Uses yfinance to download free historical data from Yahoo. Caches
-    results via Streamlit's caching to reduce repeated API calls. If the
+    results via Streamlit's caching to reduce repeated API calls, with
+    the same short TTL as `fetch_many` so that new bars show up. If the
     download fails or returns an empty DataFrame, a ValueError is
     raised.
 
@@ -60,6 +62,65 @@ def fetch(symbol: str, tf_key: str) -> Tuple[pd.DataFrame, str]:
     df = yf.download(symbol, period=cfg["period"], interval=cfg["interval"], progress=False, auto_adjust=False)
     if df is None or df.empty:
         raise ValueError("No data returned. Try a different timeframe or symbol.")
+    return _normalise(df, cfg)
+
+
+def fetch_many(symbols: Iterable[str], tf_key: str) -> Dict[str, Tuple[pd.DataFrame, str]]:
+    """Fetch market data for several symbols with a single download.
+
+    The watchlist overview needs every symbol for the same timeframe, so
+    the symbols are coalesced into one `yf.download` call instead of one
+    request each. The cache key is the sorted, de-duplicated symbol
+    tuple so that reordering the watchlist does not trigger a refetch.
+
+    Args:
+        symbols: Ticker symbols to fetch.
+        tf_key: Key into the TF mapping selecting period and interval.
+
+    Returns:
+        A dict mapping each symbol to the same (DataFrame, price_column)
+        tuple `fetch` returns. Symbols for which Yahoo returned no data
+        are omitted.
+    """
+    return _fetch_many(tuple(sorted(set(symbols))), tf_key)
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _fetch_many(symbols: Tuple[str, ...], tf_key: str) -> Dict[str, Tuple[pd.DataFrame, str]]:
+    """Cached worker for `fetch_many` keyed on a canonical symbol tuple."""
+    cfg = TF.get(tf_key)
+    if cfg is None:
+        raise KeyError(f"Unknown timeframe: {tf_key}")
+    if not symbols:
+        return {}
+    raw = yf.download(
+        " ".join(symbols),
+        period=cfg["period"],
+        interval=cfg["interval"],
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        auto_adjust=False,
+    )
+    out: Dict[str, Tuple[pd.DataFrame, str]] = {}
+    if raw is None or raw.empty:
+        return out
+    multi = isinstance(raw.columns, pd.MultiIndex)
+    tickers = set(raw.columns.get_level_values(0)) if multi else set(symbols)
+    for sym in symbols:
+        if sym not in tickers:
+            continue
+        # Rows are the union of all symbols' timestamps; drop the ones
+        # where this symbol has no bar at all
+        df = (raw[sym] if multi else raw).dropna(how="all")
+        if df.empty:
+            continue
+        out[sym] = _normalise(df, cfg)
+    return out
+
+
+def _normalise(df: pd.DataFrame, cfg: dict) -> Tuple[pd.DataFrame, str]:
+    """Apply the column and bar handling shared by the fetch functions."""
     # Normalise column names to title case (e.g. 'Close')
     df = df.rename(columns=str.title)
     # Use Adjusted Close for daily/weekly intervals, raw Close for intraday
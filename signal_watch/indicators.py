@@ -5,17 +5,46 @@ This module implements a handful of common indicators including EMA,
 MACD, RSI and Bollinger Bands. The functions operate on pandas Series
 objects and return Series aligned to the input index.  A helper
 `attach_indicators` function computes all supported indicators and
-appends them to the passed DataFrame.
+appends them to the passed DataFrame, and `update_indicators` extends
+a previous result by only the bars that are new since it was computed.
 
 No third‑party TA library is used; everything is implemented with
 vectorised pandas operations so that the project has no extra
-dependencies beyond pandas and numpy.
+dependencies beyond pandas and numpy. If Numba happens to be installed,
+`attach_indicators` instead runs compiled single-pass kernels over the
+raw price array, which matters for long histories and large watchlists.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._njit import NUMBA_AVAILABLE, njit
+
+# Storage dtype of the indicator columns. Computation stays in float64;
+# float32 is ample for display and threshold checks and halves the
+# memory the indicator columns hold per frame.
+INDICATOR_DTYPE = np.float32
+
+# Indicator parameters used by `attach_indicators`. They are also the
+# defaults of `macd`, `rsi` and `bollinger`, so the pandas and Numba
+# paths cannot drift apart.
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+RSI_PERIOD = 14
+BB_WINDOW = 20
+BB_N_STD = 2.0
+
+
+def _span_alpha(span: int) -> float:
+    """Smoothing factor of an EWM with the given span (pandas' convention)."""
+    return 2 / (span + 1)
 
 
 def ema(series: pd.Series, span: int) -> pd.Series:
@@ -31,7 +60,12 @@ def ema(series: pd.Series, span: int) -> pd.Series:
     return series.ewm(span=span, adjust=False).mean()
 
 
-def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple[pd.Series, pd.Series, pd.Series]:
+def macd(
+    close: pd.Series,
+    fast: int = MACD_FAST,
+    slow: int = MACD_SLOW,
+    signal: int = MACD_SIGNAL,
+) -> tuple[pd.Series, pd.Series, pd.Series]:
     """Calculate MACD line, signal line and histogram.
 
     The MACD line is the difference between two EMAs. The signal line
@@ -54,7 +88,7 @@ def macd(close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> t
     return macd_line, signal_line, hist
 
 
-def rsi(close: pd.Series, period: int = 14) -> pd.Series:
+def rsi(close: pd.Series, period: int = RSI_PERIOD) -> pd.Series:
     """Compute the Relative Strength Index (RSI).
 
     Uses Wilder's smoothing algorithm for averaging gains and losses.
@@ -66,21 +100,34 @@ def rsi(close: pd.Series, period: int = 14) -> pd.Series:
     Returns:
         An RSI series scaled from 0–100.
     """
+    avg_gain, avg_loss = _wilder_averages(close, period)
+    return pd.Series(_rsi_from_averages(avg_gain, avg_loss), index=close.index)
+
+
+def _wilder_averages(close: pd.Series, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """Wilder-smoothed average gain and loss behind `rsi`."""
     delta = close.diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
-    # Simple moving average of gains/losses for the first period
-    avg_gain = gain.rolling(period).mean()
-    avg_loss = loss.rolling(period).mean()
-    # Wilder's exponential smoothing for subsequent values
-    avg_gain = avg_gain.shift(1).ewm(alpha=1 / period, adjust=False).mean()
-    avg_loss = avg_loss.shift(1).ewm(alpha=1 / period, adjust=False).mean()
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    rsi_series = 100 - (100 / (1 + rs))
-    return rsi_series
-
-
-def bollinger(close: pd.Series, n: int = 20, n_std: float = 2.0) -> tuple[pd.Series, pd.Series, pd.Series]:
+    # Wilder's smoothing is an EWM with alpha = 1/period
+    avg_gain = gain.ewm(alpha=1 / period, adjust=False, min_periods=period).mean().to_numpy()
+    avg_loss = loss.ewm(alpha=1 / period, adjust=False, min_periods=period).mean().to_numpy()
+    return avg_gain, avg_loss
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI values from average gains and losses."""
+    # No losses over the window means RS is infinite and RSI pins at 100
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.where(avg_loss == 0, np.inf, avg_gain / avg_loss)
+    return 100 - 100 / (1 + rs)
+
+
+def bollinger(
+    close: pd.Series,
+    n: int = BB_WINDOW,
+    n_std: float = BB_N_STD,
+) -> tuple[pd.Series, pd.Series, pd.Series]:
     """Compute Bollinger Bands.
 
     The middle band is an n‑period simple moving average. Upper and
@@ -95,21 +142,132 @@ def bollinger(close: pd.Series, n: int = 20, n_std: float = 2.0) -> tuple[pd.Ser
     Returns:
         A tuple of (upper, middle, lower) bands.
     """
-    mid = close.rolling(n).mean()
-    std = close.rolling(n).std(ddof=0)
+    x = close.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(x)
+    # Window sums from cumulative sums, O(N) regardless of n. Values are
+    # shifted by the first valid price to limit cancellation in the
+    # sum of squares; NaNs count as missing so such windows stay NaN.
+    ref = x[valid][0] if valid.any() else 0.0
+    xc = np.where(valid, x - ref, 0.0)
+    cs = np.concatenate(([0.0], np.cumsum(xc)))
+    cs2 = np.concatenate(([0.0], np.cumsum(xc * xc)))
+    cnt = np.concatenate(([0], np.cumsum(valid)))
+    mid = np.full(len(x), np.nan)
+    std = np.full(len(x), np.nan)
+    if len(x) >= n:
+        full = (cnt[n:] - cnt[:-n]) == n
+        mean = (cs[n:] - cs[:-n]) / n
+        var = (cs2[n:] - cs2[:-n]) / n - mean * mean
+        mid[n - 1:] = np.where(full, mean + ref, np.nan)
+        std[n - 1:] = np.where(full, np.sqrt(np.maximum(var, 0.0)), np.nan)
+    mid = pd.Series(mid, index=close.index)
+    std = pd.Series(std, index=close.index)
     upper = mid + n_std * std
     lower = mid - n_std * std
     return upper, mid, lower
 
 
+@njit(cache=True, nogil=True)
+def _ema_njit(arr: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """EWM mean with ``adjust=False``, matching pandas' NaN handling."""
+    n = arr.shape[0]
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    weighted = arr[0]
+    nobs = 0 if np.isnan(weighted) else 1
+    old_wt = 1.0
+    if nobs >= min_periods:
+        out[0] = weighted
+    for i in range(1, n):
+        cur = arr[i]
+        is_obs = not np.isnan(cur)
+        if is_obs:
+            nobs += 1
+        if not np.isnan(weighted):
+            # Gaps still decay the previous weight, as with ignore_na=False
+            old_wt *= 1.0 - alpha
+            if is_obs:
+                weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        if nobs >= min_periods:
+            out[i] = weighted
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std_njit(arr: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and population std from a running sum/sum of squares.
+
+    Values are shifted by the first finite sample before accumulating to
+    keep the sum-of-squares cancellation small for high-priced tickers.
+    A window containing any NaN yields NaN, as with ``rolling(n)``.
+    """
+    size = arr.shape[0]
+    mean = np.full(size, np.nan)
+    std = np.full(size, np.nan)
+    ref = 0.0
+    for i in range(size):
+        if not np.isnan(arr[i]):
+            ref = arr[i]
+            break
+    s = 0.0
+    s2 = 0.0
+    count = 0
+    for i in range(size):
+        x = arr[i]
+        if not np.isnan(x):
+            x -= ref
+            s += x
+            s2 += x * x
+            count += 1
+        if i >= n:
+            y = arr[i - n]
+            if not np.isnan(y):
+                y -= ref
+                s -= y
+                s2 -= y * y
+                count -= 1
+        if count == n:
+            m = s / n
+            var = s2 / n - m * m
+            mean[i] = m + ref
+            std[i] = np.sqrt(var) if var > 0.0 else 0.0
+    return mean, std
+
+
+@njit(cache=True, nogil=True)
+def _rsi_wilder_njit(close: np.ndarray, period: int) -> np.ndarray:
+    """RSI with Wilder's smoothing; same semantics as `rsi`."""
+    n = close.shape[0]
+    gain = np.full(n, np.nan)
+    loss = np.full(n, np.nan)
+    for i in range(1, n):
+        d = close[i] - close[i - 1]
+        if not np.isnan(d):
+            gain[i] = d if d > 0.0 else 0.0
+            loss[i] = -d if d < 0.0 else 0.0
+    avg_gain = _ema_njit(gain, 1.0 / period, period)
+    avg_loss = _ema_njit(loss, 1.0 / period, period)
+    out = np.full(n, np.nan)
+    for i in range(n):
+        if avg_loss[i] == 0.0:
+            out[i] = 100.0
+        elif not np.isnan(avg_loss[i]):
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain[i] / avg_loss[i])
+    return out
+
+
 def attach_indicators(df: pd.DataFrame, price_col: str) -> pd.DataFrame:
     """Attach computed indicators to a DataFrame in place.
 
     This function adds MACD (line, signal and histogram), RSI and
     Bollinger Bands to the given DataFrame. Columns will be named
     ``MACD``, ``MACD_SIGNAL``, ``MACD_HIST``, ``RSI``, ``BB_UPPER``,
-    ``BB_MID`` and ``BB_LOWER``. The passed DataFrame is mutated and
-    returned for convenience.
+    ``BB_MID`` and ``BB_LOWER`` and stored as `INDICATOR_DTYPE`. The
+    passed DataFrame is mutated and returned for convenience.
 
     Args:
         df: DataFrame with a price column.
@@ -118,14 +276,204 @@ def attach_indicators(df: pd.DataFrame, price_col: str) -> pd.DataFrame:
     Returns:
         The same DataFrame with indicator columns appended.
     """
+    if NUMBA_AVAILABLE:
+        # Convert the price column once and reuse it for every kernel
+        close = df[price_col].to_numpy(dtype=np.float64)
+        macd_line = _ema_njit(close, _span_alpha(MACD_FAST)) - _ema_njit(close, _span_alpha(MACD_SLOW))
+        macd_signal = _ema_njit(macd_line, _span_alpha(MACD_SIGNAL))
+        bb_mid, bb_std = _rolling_mean_std_njit(close, BB_WINDOW)
+        df["MACD"] = macd_line.astype(INDICATOR_DTYPE)
+        df["MACD_SIGNAL"] = macd_signal.astype(INDICATOR_DTYPE)
+        df["MACD_HIST"] = (macd_line - macd_signal).astype(INDICATOR_DTYPE)
+        df["RSI"] = _rsi_wilder_njit(close, RSI_PERIOD).astype(INDICATOR_DTYPE)
+        df["BB_UPPER"] = (bb_mid + BB_N_STD * bb_std).astype(INDICATOR_DTYPE)
+        df["BB_MID"] = bb_mid.astype(INDICATOR_DTYPE)
+        df["BB_LOWER"] = (bb_mid - BB_N_STD * bb_std).astype(INDICATOR_DTYPE)
+        return df
+    _attach_pandas(df, price_col)
+    return df
+
+
+@dataclass(frozen=True)
+class IndicatorState:
+    """Recurrence values after one bar, enough to extend the indicators.
+
+    Attributes:
+        pos: Position of the bar the state was taken at.
+        first_timestamp: Index label of the first bar of the history.
+        timestamp: Index label of the bar at ``pos``.
+        close: Price at ``pos``.
+        ema_fast: Fast MACD EMA at ``pos``.
+        ema_slow: Slow MACD EMA at ``pos``.
+        macd_signal: MACD signal line at ``pos``.
+        avg_gain: Wilder average gain at ``pos``.
+        avg_loss: Wilder average loss at ``pos``.
+    """
+
+    pos: int
+    first_timestamp: Any
+    timestamp: Any
+    close: float
+    ema_fast: float
+    ema_slow: float
+    macd_signal: float
+    avg_gain: float
+    avg_loss: float
+
+
+def _attach_pandas(df: pd.DataFrame, price_col: str) -> Optional[IndicatorState]:
+    """Pandas path of `attach_indicators`.
+
+    The EMAs and Wilder averages are kept in float64 along the way, so
+    the state one bar before the end is read off them for free.
+    """
     close = df[price_col]
-    macd_line, macd_signal, macd_hist = macd(close)
-    df["MACD"] = macd_line
-    df["MACD_SIGNAL"] = macd_signal
-    df["MACD_HIST"] = macd_hist
-    df["RSI"] = rsi(close)
+    ema_fast = ema(close, MACD_FAST)
+    ema_slow = ema(close, MACD_SLOW)
+    macd_line = ema_fast - ema_slow
+    macd_signal = ema(macd_line, MACD_SIGNAL)
+    avg_gain, avg_loss = _wilder_averages(close, RSI_PERIOD)
+    df["MACD"] = macd_line.astype(INDICATOR_DTYPE)
+    df["MACD_SIGNAL"] = macd_signal.astype(INDICATOR_DTYPE)
+    df["MACD_HIST"] = (macd_line - macd_signal).astype(INDICATOR_DTYPE)
+    df["RSI"] = _rsi_from_averages(avg_gain, avg_loss).astype(INDICATOR_DTYPE)
     bb_upper, bb_mid, bb_lower = bollinger(close)
-    df["BB_UPPER"] = bb_upper
-    df["BB_MID"] = bb_mid
-    df["BB_LOWER"] = bb_lower
-    return df
+    df["BB_UPPER"] = bb_upper.astype(INDICATOR_DTYPE)
+    df["BB_MID"] = bb_mid.astype(INDICATOR_DTYPE)
+    df["BB_LOWER"] = bb_lower.astype(INDICATOR_DTYPE)
+    pos = len(df) - 2
+    if pos < 0:
+        return None
+    state = IndicatorState(
+        pos=pos,
+        first_timestamp=df.index[0],
+        timestamp=df.index[pos],
+        close=float(close.iloc[pos]),
+        ema_fast=float(ema_fast.iloc[pos]),
+        ema_slow=float(ema_slow.iloc[pos]),
+        macd_signal=float(macd_signal.iloc[pos]),
+        avg_gain=float(avg_gain[pos]),
+        avg_loss=float(avg_loss[pos]),
+    )
+    values = (state.close, state.ema_fast, state.ema_slow, state.macd_signal, state.avg_gain, state.avg_loss)
+    if not np.all(np.isfinite(values)):
+        return None
+    return state
+
+
+def update_indicators(
+    df: pd.DataFrame,
+    price_col: str,
+    prev: Optional[Tuple[pd.DataFrame, Optional[IndicatorState]]] = None,
+) -> Tuple[pd.DataFrame, Optional[IndicatorState]]:
+    """Attach indicators, reusing a previous result where possible.
+
+    When ``df`` is the history behind ``prev`` with further bars
+    appended, only the bars after the stored state are run through the
+    EMA and Wilder recurrences and a `BB_WINDOW` window for Bollinger
+    Bands; the older values are copied over. The state is kept one bar
+    before the end so that a still forming last bar (daily data during
+    the session) is recomputed on the next update. Anything else (a
+    shifted start, adjusted history, missing prices) falls back to a
+    full computation.
+
+    The Numba kernels compute a full history faster than it can be
+    extended, so with Numba installed this is `attach_indicators` and
+    no state is returned.
+
+    Args:
+        df: Freshly fetched DataFrame with a price column. It is mutated.
+        price_col: Column name to use for closing price.
+        prev: A (DataFrame, state) pair previously returned by this
+            function, or None.
+
+    Returns:
+        A tuple of (DataFrame with indicator columns, state to pass back
+        in on the next update). The state is None if the history is too
+        short or irregular to be extended.
+    """
+    if NUMBA_AVAILABLE:
+        return attach_indicators(df, price_col), None
+    if prev is not None:
+        state = _extend_indicators(df, price_col, *prev)
+        if state is not None:
+            return df, state
+    return df, _attach_pandas(df, price_col)
+
+
+def _extend_indicators(
+    df: pd.DataFrame,
+    price_col: str,
+    prev_df: pd.DataFrame,
+    state: Optional[IndicatorState],
+) -> Optional[IndicatorState]:
+    """Fill indicators for bars after ``state.pos`` and return the next state.
+
+    Returns None, leaving ``df`` untouched, if ``df`` does not extend
+    the history the state was taken from.
+    """
+    if state is None:
+        return None
+    pos = state.pos
+    n = len(df)
+    # Need at least one bar after the state and a full Bollinger window
+    if n < pos + 2 or pos + 2 < BB_WINDOW:
+        return None
+    close = df[price_col].to_numpy(dtype=np.float64)
+    if df.index[0] != state.first_timestamp or df.index[pos] != state.timestamp or close[pos] != state.close:
+        return None
+    new = close[pos + 1:]
+    if np.isnan(new).any():
+        return None
+    a_fast, a_slow, a_sig = _span_alpha(MACD_FAST), _span_alpha(MACD_SLOW), _span_alpha(MACD_SIGNAL)
+    a_rsi = 1 / RSI_PERIOD
+    ema_fast, ema_slow, sig = state.ema_fast, state.ema_slow, state.macd_signal
+    avg_gain, avg_loss, last = state.avg_gain, state.avg_loss, state.close
+    k = len(new)
+    macd_line = np.empty(k)
+    macd_signal = np.empty(k)
+    rsi_vals = np.empty(k)
+    next_state = state
+    for i, x in enumerate(new):
+        ema_fast = a_fast * x + (1 - a_fast) * ema_fast
+        ema_slow = a_slow * x + (1 - a_slow) * ema_slow
+        macd_line[i] = ema_fast - ema_slow
+        sig = a_sig * macd_line[i] + (1 - a_sig) * sig
+        macd_signal[i] = sig
+        d = x - last
+        avg_gain = a_rsi * max(d, 0.0) + (1 - a_rsi) * avg_gain
+        avg_loss = a_rsi * max(-d, 0.0) + (1 - a_rsi) * avg_loss
+        rsi_vals[i] = 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        last = x
+        if pos + 1 + i == n - 2:
+            next_state = IndicatorState(
+                pos=n - 2,
+                first_timestamp=state.first_timestamp,
+                timestamp=df.index[n - 2],
+                close=float(x),
+                ema_fast=ema_fast,
+                ema_slow=ema_slow,
+                macd_signal=sig,
+                avg_gain=avg_gain,
+                avg_loss=avg_loss,
+            )
+    # Bollinger windows ending at each new bar
+    windows = sliding_window_view(close[pos + 2 - BB_WINDOW:], BB_WINDOW)
+    bb_mid = windows.mean(axis=1)
+    bb_std = windows.std(axis=1)
+    new_cols = {
+        "MACD": macd_line,
+        "MACD_SIGNAL": macd_signal,
+        "MACD_HIST": macd_line - macd_signal,
+        "RSI": rsi_vals,
+        "BB_UPPER": bb_mid + BB_N_STD * bb_std,
+        "BB_MID": bb_mid,
+        "BB_LOWER": bb_mid - BB_N_STD * bb_std,
+    }
+    for col, values in new_cols.items():
+        # One copy of the stored prefix; nothing before pos is recomputed
+        out = np.empty(n, dtype=INDICATOR_DTYPE)
+        out[: pos + 1] = prev_df[col].to_numpy()[: pos + 1]
+        out[pos + 1:] = values
+        df[col] = out
+    return next_state
@@ -6,14 +6,31 @@ available on query1.finance.yahoo.com. It returns a list of matching
 tickers along with their names and exchanges. No API key is required.
 
 It is used by the Streamlit app to offer autocomplete suggestions when
-the user types a query in the search box.
+the user types a query in the search box. Requests reuse a pooled HTTP
+session per thread and results are cached, so retyping a query costs
+neither a new TLS handshake nor a round trip.
 """
 
 from __future__ import annotations
 
+import threading
 from typing import List, Dict
 
 import requests
+import streamlit as st
+
+# Streamlit runs each browser session's script on its own thread and
+# requests.Session is not documented as thread-safe, so every thread
+# keeps its own session; keep-alive connections are reused per thread.
+_LOCAL = threading.local()
+
+
+def _session() -> requests.Session:
+    """Return this thread's pooled HTTP session, creating it on first use."""
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = _LOCAL.session = requests.Session()
+    return session
 
 
 def yahoo_search(query: str, limit: int = 8) -> List[Dict[str, str]]:
@@ -30,19 +47,25 @@ def yahoo_search(query: str, limit: int = 8) -> List[Dict[str, str]]:
     """
     if not query:
         return []
-    url = "https://query1.finance.yahoo.com/v1/finance/search"
-    params = {"q": query, "quotesCount": limit, "newsCount": 0}
     try:
-        r = requests.get(url, params=params, timeout=10)
-        r.raise_for_status()
-        out = []
-        for q in r.json().get("quotes", []):
-            sym = q.get("symbol")
-            name = q.get("shortname") or q.get("longname") or ""
-            exch = q.get("exchDisp") or q.get("exchange") or ""
-            if sym and sym.isascii():
-                out.append({"symbol": sym, "name": name, "exchange": exch})
-        return out
+        return _cached_search(query, limit)
     except Exception:
         # In case of any error, return an empty list
         return []
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_search(query: str, limit: int) -> List[Dict[str, str]]:
+    """Query the search endpoint; errors propagate so they are not cached."""
+    url = "https://query1.finance.yahoo.com/v1/finance/search"
+    params = {"q": query, "quotesCount": limit, "newsCount": 0}
+    r = _session().get(url, params=params, timeout=10)
+    r.raise_for_status()
+    out = []
+    for q in r.json().get("quotes", []):
+        sym = q.get("symbol")
+        name = q.get("shortname") or q.get("longname") or ""
+        exch = q.get("exchDisp") or q.get("exchange") or ""
+        if sym and sym.isascii():
+            out.append({"symbol": sym, "name": name, "exchange": exch})
+    return out
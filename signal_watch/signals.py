@@ -6,15 +6,18 @@ Bollinger Band states. Each indicator is reduced to a discrete state
 (buy, sell or hold). A majority function determines an overall
 recommendation. Additional helper functions expose the age (number
 of bars since the last state change) and compute the latest
-snapshot for a DataFrame.
+snapshot for a DataFrame. `vectorized_states` evaluates the same rules
+for every bar at once, returning int8 codes instead of State members.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple
+from itertools import product
+from typing import Dict, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
@@ -122,11 +125,85 @@ def bb_state(df: pd.DataFrame, idx: int, price_col: str) -> State:
     return State.HOLD
 
 
-def signal_age(series_states: List[State], idx: int) -> int:
+# Integer codes used by the vectorised state functions
+HOLD_CODE = 0
+BUY_CODE = 1
+SELL_CODE = 2
+_CODE_STATE = (State.HOLD, State.BUY, State.SELL)
+
+
+def _encode_states(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """Encode per-transition buy/sell masks (length N-1) as N int8 codes.
+
+    The first bar has no predecessor and is always HOLD; buy takes
+    precedence over sell as in the scalar state functions.
+    """
+    codes = np.zeros(len(buy) + 1, dtype=np.int8)
+    codes[1:][sell] = SELL_CODE
+    codes[1:][buy] = BUY_CODE
+    return codes
+
+
+def macd_states(df: pd.DataFrame) -> np.ndarray:
+    """Vectorised `macd_state` for every bar, as int8 codes."""
+    m = df["MACD"].to_numpy()
+    sig = df["MACD_SIGNAL"].to_numpy()
+    buy = (m[:-1] <= sig[:-1]) & (m[1:] > sig[1:])
+    sell = (m[:-1] >= sig[:-1]) & (m[1:] < sig[1:])
+    return _encode_states(buy, sell)
+
+
+def rsi_states(df: pd.DataFrame) -> np.ndarray:
+    """Vectorised `rsi_state` for every bar, as int8 codes."""
+    r = df["RSI"].to_numpy()
+    prev, now = r[:-1], r[1:]
+    buy = ((prev <= 30) & (now > 30)) | ((prev <= 50) & (now > 50))
+    sell = ((prev >= 70) & (now < 70)) | ((prev >= 50) & (now < 50))
+    return _encode_states(buy, sell)
+
+
+def bb_states(df: pd.DataFrame, price_col: str) -> np.ndarray:
+    """Vectorised `bb_state` for every bar, as int8 codes."""
+    c = df[price_col].to_numpy()
+    upper = df["BB_UPPER"].to_numpy()
+    lower = df["BB_LOWER"].to_numpy()
+    inside = (c[1:] >= lower[1:]) & (c[1:] <= upper[1:])
+    buy = (c[:-1] < lower[:-1]) & inside
+    sell = (c[:-1] > upper[:-1]) & inside
+    return _encode_states(buy, sell)
+
+
+def vectorized_states(df: pd.DataFrame, price_col: str) -> Dict[str, np.ndarray]:
+    """Evaluate the MACD, RSI and Bollinger states for every bar.
+
+    Args:
+        df: DataFrame with indicator columns.
+        price_col: Column name to use for price in Bollinger evaluation.
+
+    Returns:
+        A dict with keys 'macd', 'rsi' and 'bb' mapping to int8 arrays
+        of `HOLD_CODE`, `BUY_CODE` or `SELL_CODE`, one per row.
+    """
+    return {
+        "macd": macd_states(df),
+        "rsi": rsi_states(df),
+        "bb": bb_states(df, price_col),
+    }
+
+
+def _as_state_array(series_states: Union[Sequence[State], np.ndarray]) -> np.ndarray:
+    """Return states as a NumPy array suitable for element-wise comparison."""
+    if isinstance(series_states, np.ndarray):
+        return series_states
+    return np.array([s.value for s in series_states])
+
+
+def signal_age(series_states: Union[Sequence[State], np.ndarray], idx: int) -> int:
     """Compute how many bars ago the given state last changed.
 
     Args:
-        series_states: List of states for each bar.
+        series_states: States for each bar, either as a list of State or
+            as an array of encoded states.
         idx: Index of the current bar.
 
     Returns:
@@ -134,21 +211,36 @@ def signal_age(series_states: List[State], idx: int) -> int:
     """
     if idx < 0:
         return 0
-    current = series_states[idx]
-    age = 0
-    for j in range(idx - 1, -1, -1):
-        if series_states[j] != current:
-            break
-        age += 1
-    return age
+    states = _as_state_array(series_states[: idx + 1])
+    changed = np.flatnonzero(states[:-1] != states[1:])
+    if len(changed) == 0:
+        return idx
+    return idx - int(changed[-1] + 1)
 
 
-def majority(macd_s: State, rsi_s: State, bb_s: State) -> State:
-    """Return the majority recommendation from three states.
+def signal_ages(series_states: Union[Sequence[State], np.ndarray]) -> np.ndarray:
+    """Compute `signal_age` for every bar in a single pass.
 
-    If two or more indicators agree on buy/sell the majority is returned,
-    otherwise hold.
+    Args:
+        series_states: States for each bar, as accepted by `signal_age`.
+
+    Returns:
+        An integer array where element i equals ``signal_age(states, i)``.
     """
+    states = _as_state_array(series_states)
+    n = len(states)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    changed = states[:-1] != states[1:]
+    # Position where the run containing each bar started
+    starts = np.zeros(n, dtype=np.int64)
+    starts[1:] = np.where(changed, np.arange(1, n), 0)
+    np.maximum.accumulate(starts, out=starts)
+    return np.arange(n) - starts
+
+
+def _vote(macd_s: State, rsi_s: State, bb_s: State) -> State:
+    """Count votes for the majority rule; used to build the lookup table."""
     votes = [macd_s, rsi_s, bb_s]
     buys = sum(1 for v in votes if v == State.BUY)
     sells = sum(1 for v in votes if v == State.SELL)
@@ -159,6 +251,19 @@ def majority(macd_s: State, rsi_s: State, bb_s: State) -> State:
     return State.HOLD
 
 
+# All 27 vote combinations resolved once at import time
+_MAJORITY_LUT = {combo: _vote(*combo) for combo in product(State, repeat=3)}
+
+
+def majority(macd_s: State, rsi_s: State, bb_s: State) -> State:
+    """Return the majority recommendation from three states.
+
+    If two or more indicators agree on buy/sell the majority is returned,
+    otherwise hold.
+    """
+    return _MAJORITY_LUT[(macd_s, rsi_s, bb_s)]
+
+
 def latest_snapshot(df: pd.DataFrame, price_col: str) -> dict:
     """Compute the latest indicator snapshot for the most recent bar.
 
@@ -175,15 +280,16 @@ def latest_snapshot(df: pd.DataFrame, price_col: str) -> dict:
     """
     if df.empty:
         raise ValueError("DataFrame is empty")
-    idx = len(df) - 1
-    macd_s = macd_state(df, idx)
-    rsi_s = rsi_state(df, idx)
-    bb_s = bb_state(df, idx, price_col)
+    # Only the last transition matters, so evaluate just the final two bars
+    codes = vectorized_states(df.iloc[-2:], price_col)
+    macd_s = _CODE_STATE[codes["macd"][-1]]
+    rsi_s = _CODE_STATE[codes["rsi"][-1]]
+    bb_s = _CODE_STATE[codes["bb"][-1]]
     maj = majority(macd_s, rsi_s, bb_s)
     return {
         "macd": macd_s,
         "rsi": rsi_s,
         "bb": bb_s,
         "majority": maj,
-        "index": df.index[idx],
+        "index": df.index[-1],
     }
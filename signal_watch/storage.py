@@ -2,8 +2,15 @@
 Watchlist persistence helpers using Streamlit session state.
 
 This module provides simple functions to manage a list of tickers in
-the user's session state. It also exposes functions to import and
-export the watchlist as JSON via Streamlit UI components.
+the user's session state. The watchlist is stored as a dict used as an
+insertion-ordered set (tickers map to None), so membership, add and
+remove are constant time; `get_watchlist` returns it as a list.
+Tickers are interned with `sys.intern` so every session shares one
+string per symbol and dict lookups can short-circuit on identity.
+Interned strings live for the life of the process, which is fine for
+the bounded universe of ticker symbols. The module also exposes
+functions to import and export the watchlist as JSON via Streamlit UI
+components.
 
 No external backend is used; watchlists are stored in memory while
 the Streamlit app is running. Users can export and later import
@@ -13,52 +20,158 @@ watchlists to persist them across sessions if desired.
 from __future__ import annotations
 
 import json
+import sys
+from itertools import islice
+from typing import List, Tuple
 
 import streamlit as st
 
+# orjson is optional; it encodes and parses considerably faster than json.
+# Both variants produce compact UTF-8 bytes.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Largest watchlist file accepted for import; real ones are a few KB
+MAX_IMPORT_BYTES = 1 << 20
+
+# Shared stand-in for a missing watchlist; avoids a fresh default per call
+_EMPTY_WL: Tuple[str, ...] = ()
+
+# Upper bound on watchlist length, keeping every per-ticker path bounded
+MAX_WATCHLIST = 1000
+
 
 def init_watchlist() -> None:
     """Initialise the watchlist in session state if not present."""
-    st.session_state.setdefault("watchlist", [])
+    st.session_state.setdefault("watchlist", {})
+
+
+def get_watchlist() -> List[str]:
+    """Return the watchlist tickers in insertion order."""
+    return list(st.session_state.get("watchlist") or _EMPTY_WL)
 
 
-def add_to_watchlist(sym: str) -> None:
-    """Add a symbol to the watchlist if it's not already present."""
-    sym = sym.upper()
-    wl = st.session_state.get("watchlist", [])
-    if sym and sym not in wl:
-        wl.append(sym)
-        st.session_state["watchlist"] = wl
+def add_to_watchlist(sym: str) -> bool:
+    """Add a symbol to the watchlist if it's not already present.
+
+    Returns:
+        True if the symbol is on the watchlist afterwards, False if it
+        is empty or was rejected because the watchlist already holds
+        `MAX_WATCHLIST` tickers.
+    """
+    if not sym:
+        return False
+    # The app already passes upper-case tickers; skip the copy then
+    if not sym.isupper():
+        sym = sym.upper()
+    sym = sys.intern(sym)
+    wl = st.session_state.setdefault("watchlist", {})
+    # Mutate in place and only when something changes
+    if sym not in wl:
+        if len(wl) >= MAX_WATCHLIST:
+            return False
+        wl[sym] = None
+    return True
 
 
 def remove_from_watchlist(sym: str) -> None:
     """Remove a symbol from the watchlist."""
-    sym = sym.upper()
-    wl = st.session_state.get("watchlist", [])
-    st.session_state["watchlist"] = [s for s in wl if s != sym]
+    wl = st.session_state.get("watchlist")
+    if wl:
+        # Pop in place; absent symbols are ignored like list.remove misses
+        wl.pop(sym if sym.isupper() else sym.upper(), None)
+
+
+def _serialize_watchlist(tickers: Tuple[str, ...]) -> bytes:
+    """Serialise tickers to the export JSON."""
+    return _json_dumps({"watchlist": list(tickers)})
 
 
 def export_watchlist_button() -> None:
-    """Render a button that exports the watchlist to a JSON download."""
-    wl = st.session_state.get("watchlist", [])
-    data = {"watchlist": wl}
+    """Render a button that exports the watchlist to a JSON download.
+
+    The payload is memoised in session state next to the tickers it was
+    built from, so unchanged reruns skip serialisation entirely.
+    """
+    tickers = tuple(st.session_state.get("watchlist") or _EMPTY_WL)
+    # Compare the tuple itself rather than its hash to rule out collisions
+    if st.session_state.get("_wl_export_key") != tickers:
+        st.session_state["_wl_export_bytes"] = _serialize_watchlist(tickers)
+        st.session_state["_wl_export_key"] = tickers
     st.download_button(
         label="Export Watchlist",
-        data=json.dumps(data, indent=2),
+        data=st.session_state["_wl_export_bytes"],
         file_name="watchlist.json",
         mime="application/json",
     )
 
 
 def import_watchlist_uploader() -> None:
-    """Render an uploader that imports a watchlist from JSON."""
+    """Render an uploader that imports a watchlist from JSON.
+
+    The uploader keeps its file across reruns, so each upload is only
+    parsed once; later reruns would otherwise re-import it and discard
+    any tickers added since.
+    """
     f = st.file_uploader("Import Watchlist JSON", type="json")
-    if f is not None:
+    # Outcome of an import from the run before the app-wide rerun
+    notice = st.session_state.pop("_wl_import_notice", None)
+    if notice == "truncated":
+        st.warning(f"Imported watchlist, truncated to the first {MAX_WATCHLIST} tickers.")
+    elif notice == "imported":
+        st.success("Imported watchlist.")
+    if f is not None and st.session_state.get("_wl_import_id") != f.file_id:
+        st.session_state["_wl_import_id"] = f.file_id
+        # The upload is already in memory; the cap bounds the parse time
+        if f.size > MAX_IMPORT_BYTES:
+            st.error(f"Failed to import watchlist: file exceeds {MAX_IMPORT_BYTES // 1024} KB.")
+            return
         try:
-            obj = json.load(f)
+            # Parse the uploaded bytes in one go, without a text wrapper
+            obj = _json_loads(f.getvalue())
             if isinstance(obj, dict) and "watchlist" in obj:
-                wl = list(dict.fromkeys([s.upper() for s in obj["watchlist"] if isinstance(s, str)]))
+                # One pass: filter, normalise and de-duplicate into the dict.
+                # JSON decoders only produce exact str, so skip the MRO walk.
+                wl = dict.fromkeys(
+                    sys.intern(s.upper()) for s in obj.get("watchlist", ()) if type(s) is str
+                )
+                notice = "imported"
+                if len(wl) > MAX_WATCHLIST:
+                    wl = dict.fromkeys(islice(wl, MAX_WATCHLIST))
+                    notice = "truncated"
                 st.session_state["watchlist"] = wl
-                st.success("Imported watchlist.")
-        except Exception as e:
+                st.session_state["_wl_import_notice"] = notice
+                # Rerun the whole app so the sidebar and overview pick up
+                # the new list; _wl_import_id keeps this from repeating
+                st.rerun()
+        # Malformed JSON (orjson's error subclasses ValueError), bad
+        # encodings, a non-iterable "watchlist" value and deeply nested
+        # input that overflows the stdlib parser; bugs propagate
+        except (
+            json.JSONDecodeError,
+            UnicodeDecodeError,
+            TypeError,
+            ValueError,
+            RecursionError,
+        ) as e:
             st.error(f"Failed to import watchlist: {e}")
+
+
+@st.fragment
+def watchlist_panel() -> None:
+    """Render the import/export controls as a Streamlit fragment.
+
+    Interacting with these widgets reruns only this fragment instead of
+    the whole app. On full reruns the fragment still renders, but the
+    export is memoised and an upload is only parsed once. A successful
+    import triggers one app-wide rerun so the rest of the page shows
+    the new watchlist immediately.
+    """
+    import_watchlist_uploader()
+    export_watchlist_button()
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from signal_watch import indicators
+
+COLUMNS = ["MACD", "MACD_SIGNAL", "MACD_HIST", "RSI", "BB_UPPER", "BB_MID", "BB_LOWER"]
+
+
+@pytest.fixture
+def no_numba(monkeypatch):
+    monkeypatch.setattr(indicators, "NUMBA_AVAILABLE", False)
+
+
+def _frame(close, start="2020-01-01"):
+    return pd.DataFrame({"Close": close}, index=pd.date_range(start, periods=len(close)))
+
+
+def _prices(n=300, seed=0):
+    return 100 + np.random.default_rng(seed).standard_normal(n).cumsum()
+
+
+def _assert_matches_full(df):
+    full = indicators.attach_indicators(_frame(df["Close"].to_numpy(), df.index[0]), "Close")
+    for col in COLUMNS:
+        np.testing.assert_allclose(df[col], full[col], rtol=1e-5, equal_nan=True)
+
+
+def test_extension_matches_full_computation(no_numba):
+    close = _prices()
+    prev = indicators.update_indicators(_frame(close[:250]), "Close")
+    assert prev[1] is not None and prev[1].pos == 248
+    for n in (251, 255, 300):
+        df, state = indicators.update_indicators(_frame(close[:n]), "Close", prev)
+        _assert_matches_full(df)
+        assert state.pos == n - 2
+        prev = (df, state)
+
+
+def test_revised_last_bar_is_recomputed(no_numba):
+    close = _prices()
+    prev = indicators.update_indicators(_frame(close[:250]), "Close")
+    revised = close[:251].copy()
+    revised[249] += 5.0
+    df, _ = indicators.update_indicators(_frame(revised), "Close", prev)
+    _assert_matches_full(df)
+
+
+@pytest.mark.parametrize("change", ["shifted_start", "adjusted_history", "missing_price"])
+def test_irregular_history_falls_back(no_numba, change):
+    close = _prices()
+    prev = indicators.update_indicators(_frame(close[:250]), "Close")
+    if change == "shifted_start":
+        new = _frame(close[1:252], start="2020-01-02")
+    elif change == "adjusted_history":
+        new = _frame(close[:252] * 0.5)
+    else:
+        values = close[:252].copy()
+        values[251] = np.nan
+        new = _frame(values)
+    df, _ = indicators.update_indicators(new, "Close", prev)
+    _assert_matches_full(df)
+
+
+def test_short_history_has_no_state(no_numba):
+    _, state = indicators.update_indicators(_frame(_prices(1)), "Close")
+    assert state is None
+
+
+def test_numba_path_skips_state(monkeypatch):
+    monkeypatch.setattr(indicators, "NUMBA_AVAILABLE", True)
+    close = _prices()
+    prev = indicators.update_indicators(_frame(close[:250]), "Close")
+    assert prev[1] is None
+    df, state = indicators.update_indicators(_frame(close[:251]), "Close", prev)
+    assert state is None
+    _assert_matches_full(df)